@@ -16,26 +16,62 @@ SETUP:
 3. Run script and enter API key when prompted
 """
 
-import pandas as pd
+import csv
+import gzip
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import os
 import sys
 import signal
 import argparse
 import logging
+import logging.handlers
 import getpass
 import json
-import re
+import string
+import atexit
+import sqlite3
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain
 import threading
-from typing import Optional, Tuple, List, Dict
+from functools import lru_cache
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Tuple, List, Dict, Iterator, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logging.getLogger('requests').setLevel(logging.CRITICAL)
 logger = logging.getLogger(__name__)
 
+# Per-item progress output is buffered and written in blocks (flushed at checkpoints and on exit)
+PROGRESS_BUFFER_RECORDS = 200
+progress_handler = logging.handlers.MemoryHandler(
+    PROGRESS_BUFFER_RECORDS,
+    flushLevel=logging.WARNING,
+    target=logging.StreamHandler(sys.stdout)
+)
+progress_logger = logging.getLogger(__name__ + '.progress')
+progress_logger.addHandler(progress_handler)
+progress_logger.propagate = False
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -45,29 +81,124 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DOI_INPUT_FILE = os.path.join(SCRIPT_DIR, "dois.txt")
 TITLE_INPUT_FILE = os.path.join(SCRIPT_DIR, "titles.txt")
 OUTPUT_FILE = os.path.join(SCRIPT_DIR, "scopus_results.csv")
-CHECKPOINT_FILE = os.path.join(SCRIPT_DIR, "checkpoint.json")
-CACHE_FILE = os.path.join(SCRIPT_DIR, ".scopus_cache.json")
+CHECKPOINT_FILE = os.path.join(SCRIPT_DIR, "checkpoint.jsonl.gz")
+CHECKPOINT_META_FILE = os.path.join(SCRIPT_DIR, "checkpoint.jsonl.meta.json")
+CACHE_FILE = os.path.join(SCRIPT_DIR, ".scopus_cache.db")
+LEGACY_CACHE_FILE = os.path.join(SCRIPT_DIR, ".scopus_cache.json")
 SCOPUS_KEY_FILE = os.path.join(SCRIPT_DIR, ".scopus_api_key")
+HTTP_CACHE_NAME = os.path.join(SCRIPT_DIR, ".http_cache")
+HTTP_CACHE_FILE = HTTP_CACHE_NAME + ".sqlite"
 VALIDATION_REPORT_FILE = os.path.join(SCRIPT_DIR, "validation_report.txt")
 
 SCOPUS_SEARCH_API = "https://api.elsevier.com/content/search/scopus"
+SCOPUS_FIELDS = "dc:title,eid,prism:doi"
+
+# HTTP response cache lifetime per host (seconds), used when requests-cache is installed
+HTTP_CACHE_EXPIRE = 7 * 24 * 3600
+HTTP_CACHE_EXPIRE_BY_HOST = {
+    'api.elsevier.com': 7 * 24 * 3600,
+    'api.openalex.org': 24 * 3600
+}
 
 DELAY_BETWEEN_REQUESTS = 1
 TIMEOUT = 30
 MAX_WORKERS = 3
+SCOPUS_BATCH_SIZE = 25
 
-DOI_PATTERN = re.compile(r'^10\.\d{4,9}/[-._;()/:A-Z0-9]+$', re.IGNORECASE)
+# DOI format: 10.<4-9 digit registrant>/<suffix of these characters>
+# ASCII only: unlike the former case-insensitive regex, non-ASCII case variants
+# such as 'ı' (U+0131), 'ſ' (U+017F) and 'K' (U+212A) are rejected.
+DOI_SUFFIX_CHARS = frozenset(string.ascii_letters + string.digits + '-._;()/:')
 MIN_TITLE_LENGTH = 10
+CACHE_FLUSH_EVERY = 50
 
-interrupt_flag = False
+def create_session(use_cache: bool = True) -> requests.Session:
+    """Create HTTP session, with an on-disk response cache if enabled and requests-cache is installed"""
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=HTTP_CACHE_NAME,
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE,
+            urls_expire_after=HTTP_CACHE_EXPIRE_BY_HOST,
+            allowable_codes=(200, 404),
+            allowable_methods=('GET',),
+            ignored_parameters=['apiKey']
+        )
+    else:
+        session = requests.Session()
+    session.headers['Accept-Encoding'] = 'gzip'
+    return session
+
+SESSION: Optional[requests.Session] = None
+
+INTERRUPT = threading.Event()
 requests_made = 0
 errors_count = 0
 cache_hits = 0
+stats_lock = threading.Lock()
+last_flushed_idx = 0
+present_files: Optional[Set[str]] = None
+
+# ============================================================
+# SERIALIZATION & FILES
+# ============================================================
+
+def dumps_json(obj) -> str:
+    """Serialize to compact JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def loads_json(data: str):
+    """Parse JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@contextmanager
+def atomic_write(path: str, opener=open, **kwargs):
+    """Write to a temp file, then atomically replace `path` so a crash never leaves it truncated"""
+    tmp_path = path + '.tmp'
+    try:
+        with opener(tmp_path, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def scan_script_dir() -> Set[str]:
+    """List file names in SCRIPT_DIR with a single directory scan"""
+    try:
+        with os.scandir(SCRIPT_DIR) as entries:
+            return {entry.name for entry in entries}
+    except OSError as e:
+        logger.warning(f"Could not scan {SCRIPT_DIR}: {e}")
+        return set()
+
+def file_present(path: str) -> bool:
+    """Check file existence, using the startup scan for files in SCRIPT_DIR"""
+    if present_files is not None and os.path.dirname(path) == SCRIPT_DIR:
+        return os.path.basename(path) in present_files
+    return os.path.exists(path)
+
+def mark_file(path: str, present: bool):
+    """Keep the startup scan in sync after creating or deleting a file"""
+    if present_files is not None and os.path.dirname(path) == SCRIPT_DIR:
+        if present:
+            present_files.add(os.path.basename(path))
+        else:
+            present_files.discard(os.path.basename(path))
 
 # ============================================================
 # VALIDATION
 # ============================================================
 
+@lru_cache(maxsize=8192)
+def normalize_key(item: str) -> str:
+    """Normalize DOI/title for duplicate detection and cache keys"""
+    return item.lower().strip()
+
 class InputValidator:
     """Validate DOIs and titles before processing"""
     
@@ -77,7 +208,12 @@ class InputValidator:
         doi = doi.strip()
         if not doi:
             return False, "Empty DOI"
-        if not DOI_PATTERN.match(doi):
+        slash = doi.find('/')
+        prefix = doi[3:slash]
+        suffix = doi[slash + 1:]
+        if (not doi.startswith('10.') or slash < 0
+                or not 4 <= len(prefix) <= 9 or not prefix.isdecimal()
+                or not suffix or not DOI_SUFFIX_CHARS.issuperset(suffix)):
             return False, f"Invalid DOI format: {doi}"
         return True, ""
     
@@ -94,16 +230,17 @@ class InputValidator:
     @staticmethod
     def detect_duplicates(items: List[str]) -> Tuple[List[str], List[Tuple[int, str, int]]]:
         """Detect duplicates and return (unique_items, duplicates_info)"""
-        seen = {}
+        norm = [normalize_key(item) for item in items]
+        seen: Dict[str, int] = {}
         unique = []
         duplicates = []
         
         for i, item in enumerate(items):
-            normalized = item.lower().strip()
-            if normalized in seen:
-                duplicates.append((i + 1, item, seen[normalized] + 1))
+            first_seen = seen.get(norm[i])
+            if first_seen is not None:
+                duplicates.append((i + 1, item, first_seen + 1))
             else:
-                seen[normalized] = i
+                seen[norm[i]] = i
                 unique.append(item)
         
         return unique, duplicates
@@ -141,50 +278,123 @@ class InputValidator:
 # ============================================================
 
 class ResultCache:
-    """Cache Scopus API responses"""
+    """Cache Scopus API responses in a SQLite database"""
     
-    def __init__(self, cache_file: str):
+    def __init__(self, cache_file: str, flush_every: int = CACHE_FLUSH_EVERY, legacy_file: Optional[str] = None):
         self.cache_file = cache_file
-        self.cache = self._load_cache()
         self.lock = threading.Lock()
+        self.flush_every = flush_every
+        self.dirty = False
+        self.writes_since_flush = 0
+        self.conn = self._open_cache()
+        if legacy_file and os.path.exists(legacy_file):
+            self._import_legacy_cache(legacy_file)
+        self.cache = self._load_cache()
+        atexit.register(self.flush)
+    
+    def _open_cache(self) -> sqlite3.Connection:
+        """Open cache database and create schema"""
+        conn = sqlite3.connect(self.cache_file, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, value TEXT, cached_at REAL)")
+        return conn
+    
+    def _import_legacy_cache(self, legacy_file: str):
+        """One-time import of the old JSON cache file, which is then renamed to .bak"""
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            rows = []
+            for key, value in legacy.items():
+                cached_at = value.get('cached_at')
+                if isinstance(cached_at, str):
+                    try:
+                        cached_at = datetime.fromisoformat(cached_at).timestamp()
+                    except ValueError:
+                        cached_at = None
+                value['cached_at'] = cached_at
+                rows.append((normalize_key(key), dumps_json(value), cached_at))
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO cache(key, value, cached_at) VALUES (?, ?, ?)", rows
+                )
+            os.replace(legacy_file, legacy_file + '.bak')
+            print(f"✅ Imported {len(rows)} entries from {os.path.basename(legacy_file)} "
+                  f"(old file kept as {os.path.basename(legacy_file)}.bak)")
+        except Exception as e:
+            logger.warning(f"Could not import legacy cache {legacy_file}: {e}")
     
     def _load_cache(self) -> Dict:
-        """Load cache from file"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load cache: {e}")
-        return {}
-    
-    def _save_cache(self):
-        """Save cache to file"""
+        """Load all cache entries into memory"""
+        cache = {}
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.warning(f"Could not save cache: {e}")
+            for key, value in self.conn.execute("SELECT key, value FROM cache"):
+                try:
+                    cache[key] = loads_json(value)
+                except ValueError as e:
+                    logger.warning(f"Could not decode cache entry: {e}")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load cache: {e}")
+        return cache
     
     def get(self, key: str) -> Optional[Dict]:
         """Get cached result"""
-        with self.lock:
-            normalized_key = key.lower().strip()
-            return self.cache.get(normalized_key)
+        return self.get_or_none_normalized(normalize_key(key))
+    
+    def get_or_none_normalized(self, nkey: str) -> Optional[Dict]:
+        """Get cached result by already-normalized key (lock-free, single dict lookup is atomic)"""
+        return self.cache.get(nkey)
     
     def set(self, key: str, value: Dict):
         """Store result in cache"""
+        self.set_normalized(normalize_key(key), value)
+    
+    def set_normalized(self, nkey: str, value: Dict):
+        """Store result in cache by already-normalized key"""
         with self.lock:
-            normalized_key = key.lower().strip()
-            value['cached_at'] = datetime.now().isoformat()
-            self.cache[normalized_key] = value
-            self._save_cache()
+            value['cached_at'] = time.time()
+            try:
+                if not self.dirty:
+                    self.conn.execute("BEGIN")
+                    self.dirty = True
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache(key, value, cached_at) VALUES (?, ?, ?)",
+                    (nkey, dumps_json(value), value['cached_at'])
+                )
+                self.writes_since_flush += 1
+                if self.writes_since_flush >= self.flush_every:
+                    self._commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not save cache entry: {e}")
+            self.cache[nkey] = value
+    
+    def _commit(self):
+        """Commit pending transaction"""
+        try:
+            self.conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save cache: {e}")
+        self.dirty = False
+        self.writes_since_flush = 0
+    
+    def flush(self):
+        """Commit pending changes to database"""
+        with self.lock:
+            if self.dirty:
+                self._commit()
     
     def clear(self):
         """Clear all cache"""
         with self.lock:
+            if self.dirty:
+                self._commit()
             self.cache = {}
-            self._save_cache()
+            try:
+                self.conn.execute("DELETE FROM cache")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not clear cache: {e}")
     
     def stats(self) -> Dict:
         """Get cache statistics"""
@@ -201,7 +411,7 @@ class ResultCache:
 
 def load_or_prompt_scopus_key():
     """Load Scopus API key from file or prompt user"""
-    if os.path.exists(SCOPUS_KEY_FILE):
+    if file_present(SCOPUS_KEY_FILE):
         try:
             with open(SCOPUS_KEY_FILE, 'r') as f:
                 key = f.read().strip()
@@ -225,6 +435,7 @@ def load_or_prompt_scopus_key():
             with open(SCOPUS_KEY_FILE, 'w') as f:
                 f.write(api_key)
             os.chmod(SCOPUS_KEY_FILE, 0o600)
+            mark_file(SCOPUS_KEY_FILE, True)
             print(f"✅ API key saved to {SCOPUS_KEY_FILE}")
         except IOError as e:
             logger.warning(f"Could not save API key: {e}")
@@ -244,7 +455,7 @@ def test_api_key(api_key: str) -> Tuple[bool, str]:
             'apiKey': api_key,
             'httpAccept': 'application/json'
         }
-        response = requests.get(SCOPUS_SEARCH_API, params=params, timeout=TIMEOUT)
+        response = SESSION.get(SCOPUS_SEARCH_API, params=params, timeout=TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -268,11 +479,12 @@ def test_api_key(api_key: str) -> Tuple[bool, str]:
 def create_gitignore_entry():
     """Add cache and API key files to .gitignore"""
     gitignore_path = os.path.join(SCRIPT_DIR, ".gitignore")
-    entries = [".scopus_api_key", ".scopus_cache.json"]
+    entries = [".scopus_api_key", ".scopus_cache.json", ".scopus_cache.json.bak",
+               ".scopus_cache.db", ".scopus_cache.db-wal", ".scopus_cache.db-shm", ".http_cache.sqlite"]
     
     try:
         existing_content = ""
-        if os.path.exists(gitignore_path):
+        if file_present(gitignore_path):
             with open(gitignore_path, 'r') as f:
                 existing_content = f.read()
         
@@ -287,6 +499,7 @@ def create_gitignore_entry():
                     f.write('\n')
                 for entry in new_entries:
                     f.write(f"{entry}\n")
+            mark_file(gitignore_path, True)
             print(f"✅ Updated .gitignore with: {', '.join(new_entries)}")
     except IOError as e:
         logger.warning(f"Could not update .gitignore: {e}")
@@ -295,124 +508,173 @@ def create_gitignore_entry():
 # API FUNCTIONS
 # ============================================================
 
+class RateLimiter:
+    """Space out requests evenly across worker threads"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def wait(self):
+        """Block until the next request slot is available"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now and INTERRUPT.wait(slot - now):
+            raise KeyboardInterrupt()
+
+rate_limiter = RateLimiter(DELAY_BETWEEN_REQUESTS / MAX_WORKERS)
+
+def configure_session(workers: int, use_cache: bool = True):
+    """Create the shared HTTP session, with a connection pool sized for the number of workers"""
+    global SESSION
+    
+    SESSION = create_session(use_cache)
+    adapter = HTTPAdapter(
+        pool_connections=workers,
+        pool_maxsize=workers * 2,
+        # raise_on_status=False hands the final 429/5xx response back, so the status handlers still see it
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    )
+    SESSION.mount('https://', adapter)
+
+def is_cached(url: str, params: Optional[Dict] = None) -> bool:
+    """Check whether the HTTP cache holds an unexpired response for this GET request"""
+    if requests_cache is None or not isinstance(SESSION, requests_cache.CachedSession):
+        return False
+    request = SESSION.prepare_request(requests.Request('GET', url, params=params))
+    cached = SESSION.cache.get_response(SESSION.cache.create_key(request))
+    return cached is not None and not cached.is_expired
+
+def http_get(url: str, params: Optional[Dict] = None) -> requests.Response:
+    """GET through the shared session - throttled and counted only when not served from the HTTP cache"""
+    global requests_made
+    
+    if not is_cached(url, params):
+        rate_limiter.wait()
+        with stats_lock:
+            requests_made += 1
+    return SESSION.get(url, params=params, timeout=TIMEOUT)
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C"""
-    global interrupt_flag
-    interrupt_flag = True
+    INTERRUPT.set()
     print("\n\n⚠️ INTERRUPT")
     sys.exit(0)
 
-def search_scopus_api(doi: str, api_key: str) -> Tuple[Optional[str], Optional[str]]:
-    """Search Scopus API by DOI - Returns title and Scopus ID"""
-    global requests_made, errors_count
+def _handle_ok(response: requests.Response) -> Optional[List[Dict]]:
+    """200: return result entries"""
+    return response.json().get('search-results', {}).get('entry')
+
+def _handle_unauth(response: requests.Response) -> None:
+    """401: invalid API key"""
+    logger.error("Unauthorized - check Scopus API key")
+
+def _handle_rate_limit(response: requests.Response) -> None:
+    """429: back off before the next request"""
+    logger.warning("Rate limited - waiting...")
+    INTERRUPT.wait(5)
+
+def _handle_default(response: requests.Response) -> None:
+    """Any other status: no results"""
+
+_STATUS_HANDLERS = {200: _handle_ok, 401: _handle_unauth, 429: _handle_rate_limit}
+
+def _scopus_search(query: str, api_key: str, count: int) -> Optional[List[Dict]]:
+    """Run a Scopus search query - Returns result entries, or None on error/no results"""
+    global errors_count
     
-    if interrupt_flag:
+    if INTERRUPT.is_set():
         raise KeyboardInterrupt()
     
     try:
-        requests_made += 1
         params = {
-            'query': f'DOI({doi})',
+            'query': query,
             'apiKey': api_key,
-            'httpAccept': 'application/json'
+            'httpAccept': 'application/json',
+            'count': count,
+            'field': SCOPUS_FIELDS
         }
-        response = requests.get(SCOPUS_SEARCH_API, params=params, timeout=TIMEOUT)
+        response = http_get(SCOPUS_SEARCH_API, params)
         
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('search-results', {}).get('entry'):
-                entry = data['search-results']['entry'][0]
-                title = entry.get('dc:title')
-                scopus_id = entry.get('eid')
-                return title, scopus_id
-        elif response.status_code == 401:
-            logger.error("Unauthorized - check Scopus API key")
-        elif response.status_code == 429:
-            logger.warning("Rate limited - waiting...")
-            time.sleep(5)
+        entries = _STATUS_HANDLERS.get(response.status_code, _handle_default)(response)
+        if entries:
+            return entries
         
-        errors_count += 1
-        return None, None
+        with stats_lock:
+            errors_count += 1
+        return None
     except requests.RequestException as e:
         logger.debug(f"Scopus API error: {e}")
-        errors_count += 1
-        return None, None
+        with stats_lock:
+            errors_count += 1
+        return None
+
+def _scopus_get(query: str, api_key: str) -> Optional[Dict]:
+    """Run a Scopus search query - Returns the first entry or None"""
+    entries = _scopus_search(query, api_key, count=1)
+    return entries[0] if entries else None
+
+def search_scopus_api(doi: str, api_key: str) -> Tuple[Optional[str], Optional[str]]:
+    """Search Scopus API by DOI - Returns title and Scopus ID"""
+    entry = _scopus_get(f'DOI({doi})', api_key)
+    return (entry.get('dc:title'), entry.get('eid')) if entry else (None, None)
+
+def search_scopus_api_batch(dois: List[str], api_key: str) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Search Scopus API for several DOIs in one request - Returns {normalized DOI: (title, Scopus ID)}"""
+    entries = _scopus_search(' OR '.join(f'DOI({doi})' for doi in dois), api_key, count=SCOPUS_BATCH_SIZE)
+    found = {}
+    for entry in entries or []:
+        doi = entry.get('prism:doi')
+        scopus_id = entry.get('eid')
+        if doi and scopus_id:
+            found[normalize_key(doi)] = (entry.get('dc:title'), scopus_id)
+    return found
+
+def search_scopus_api_title(title: str, api_key: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Search Scopus API by title"""
+    entry = _scopus_get(f'TITLE({title})', api_key)
+    return (entry.get('dc:title'), entry.get('eid'), entry.get('prism:doi')) if entry else (None, None, None)
 
 def search_openalex_doi(doi: str) -> Optional[str]:
     """Search OpenAlex by DOI - Returns only title for logging purposes"""
-    global requests_made, errors_count
+    global errors_count
     
-    if interrupt_flag:
+    if INTERRUPT.is_set():
         raise KeyboardInterrupt()
     
     try:
-        requests_made += 1
         url = f"https://api.openalex.org/works/https://doi.org/{doi}"
-        response = requests.get(url, timeout=TIMEOUT)
+        response = http_get(url)
         
         if response.status_code == 200:
             data = response.json()
             return data.get('title')
         
-        errors_count += 1
+        with stats_lock:
+            errors_count += 1
         return None
     except requests.RequestException as e:
         logger.debug(f"OpenAlex API error: {e}")
-        errors_count += 1
+        with stats_lock:
+            errors_count += 1
         return None
 
-def search_scopus_api_title(title: str, api_key: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-    """Search Scopus API by title"""
-    global requests_made, errors_count
-    
-    if interrupt_flag:
-        raise KeyboardInterrupt()
-    
-    try:
-        requests_made += 1
-        params = {
-            'query': f'TITLE({title})',
-            'apiKey': api_key,
-            'httpAccept': 'application/json',
-            'count': 1
-        }
-        response = requests.get(SCOPUS_SEARCH_API, params=params, timeout=TIMEOUT)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('search-results', {}).get('entry'):
-                entry = data['search-results']['entry'][0]
-                title_found = entry.get('dc:title')
-                scopus_id = entry.get('eid')
-                doi = entry.get('prism:doi')
-                return title_found, scopus_id, doi
-        elif response.status_code == 401:
-            logger.error("Unauthorized - check Scopus API key")
-        elif response.status_code == 429:
-            logger.warning("Rate limited - waiting...")
-            time.sleep(5)
-        
-        errors_count += 1
-        return None, None, None
-    except requests.RequestException as e:
-        logger.debug(f"Scopus API error: {e}")
-        errors_count += 1
-        return None, None, None
-
 def search_openalex_title(title: str) -> Tuple[Optional[str], Optional[str]]:
     """Search OpenAlex by title - Returns title and DOI for matching"""
-    global requests_made, errors_count
+    global errors_count
     
-    if interrupt_flag:
+    if INTERRUPT.is_set():
         raise KeyboardInterrupt()
     
     try:
-        requests_made += 1
         params = {
             'search': title,
             'per-page': 1
         }
-        response = requests.get("https://api.openalex.org/works", params=params, timeout=TIMEOUT)
+        response = http_get("https://api.openalex.org/works", params)
         
         if response.status_code == 200:
             data = response.json()
@@ -424,11 +686,13 @@ def search_openalex_title(title: str) -> Tuple[Optional[str], Optional[str]]:
                     doi = result['ids']['doi'].replace('https://doi.org/', '')
                 return title_found, doi
         
-        errors_count += 1
+        with stats_lock:
+            errors_count += 1
         return None, None
     except requests.RequestException as e:
         logger.debug(f"OpenAlex API error: {e}")
-        errors_count += 1
+        with stats_lock:
+            errors_count += 1
         return None, None
 
 # ============================================================
@@ -437,13 +701,11 @@ def search_openalex_title(title: str) -> Tuple[Optional[str], Optional[str]]:
 
 def load_items_from_file(filepath: str) -> List[str]:
     """Load items from file"""
-    if not os.path.exists(filepath):
+    if not file_present(filepath):
         raise FileNotFoundError(f"File {filepath} not found!")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        items = [line.strip() for line in f if line.strip()]
-    
-    return items
+    lines = (line.strip() for line in Path(filepath).read_text(encoding='utf-8').split('\n'))
+    return [line for line in lines if line]
 
 def save_validation_report(report: Dict, search_mode: str):
     """Save validation report to file"""
@@ -479,37 +741,88 @@ def save_validation_report(report: Dict, search_mode: str):
     except IOError as e:
         logger.warning(f"Could not save validation report: {e}")
 
-def load_checkpoint() -> Optional[Dict]:
-    """Load checkpoint from file"""
-    if os.path.exists(CHECKPOINT_FILE):
+def load_checkpoint(search_mode: str) -> Optional[Dict]:
+    """Load checkpoint metadata and stream results from JSONL file"""
+    if not file_present(CHECKPOINT_META_FILE):
+        return None
+    try:
+        with open(CHECKPOINT_META_FILE, 'r', encoding='utf-8') as f:
+            metadata = loads_json(f.read())
+        if metadata.get('search_mode') != search_mode:
+            logger.warning(f"Checkpoint is from a {str(metadata.get('search_mode')).upper()} run, ignoring it for {search_mode.upper()} mode")
+            return None
+        last_index = metadata['last_processed_index']
+        
+        by_index = {}
         try:
-            with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Could not load checkpoint: {e}")
+            with gzip.open(CHECKPOINT_FILE, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = loads_json(line)
+                    except ValueError:
+                        break  # Partially written last line
+                    if record['idx'] <= last_index:
+                        by_index[record['idx']] = record['result']
+        except EOFError:
+            pass  # Truncated last gzip member, keep records read so far
+        
+        if len(by_index) < last_index:
+            logger.warning("Checkpoint is incomplete, ignoring it")
+            return None
+        return {
+            'metadata': metadata,
+            'results': [by_index[idx] for idx in range(1, last_index + 1)]
+        }
+    except Exception as e:
+        logger.warning(f"Could not load checkpoint: {e}")
     return None
 
+def start_checkpoint(existing_results: List[Dict]):
+    """Prepare checkpoint for appending after already saved results"""
+    global last_flushed_idx
+    last_flushed_idx = 0
+    if not existing_results:
+        for path in (CHECKPOINT_FILE, CHECKPOINT_META_FILE):
+            if file_present(path):
+                os.remove(path)
+                mark_file(path, False)
+        return
+    
+    # Rewrite once on resume, so a truncated gzip member from a crash doesn't hide later appends
+    try:
+        with atomic_write(CHECKPOINT_FILE, gzip.open, mode='wt', encoding='utf-8', compresslevel=1) as f:
+            for idx, result in enumerate(existing_results, 1):
+                f.write(dumps_json({'idx': idx, 'result': result}) + '\n')
+        last_flushed_idx = len(existing_results)
+    except IOError as e:
+        logger.warning(f"Could not rewrite checkpoint: {e}")
+
 def save_checkpoint(metadata: Dict, results: List[Dict]):
-    """Save checkpoint to file"""
+    """Append new results to checkpoint and update metadata"""
+    global last_flushed_idx
     try:
-        checkpoint = {
-            'metadata': metadata,
-            'results': results
-        }
-        with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint, f, indent=2, ensure_ascii=False)
+        with gzip.open(CHECKPOINT_FILE, 'at', encoding='utf-8', compresslevel=1) as f:
+            for idx in range(last_flushed_idx, len(results)):
+                record = {'idx': idx + 1, 'result': results[idx]}
+                f.write(dumps_json(record) + '\n')
+        last_flushed_idx = len(results)
+        with atomic_write(CHECKPOINT_META_FILE, mode='w', encoding='utf-8') as f:
+            f.write(dumps_json(metadata))
     except IOError as e:
         logger.warning(f"Could not save checkpoint: {e}")
 
 def save_final_results(results: List[Dict], search_mode: str):
     """Save final results to CSV"""
+    fieldnames = ['doi', 'title', 'scopus_id'] if search_mode == 'doi' else ['search_title', 'found_title', 'scopus_id', 'doi']
     try:
-        df = pd.DataFrame(results)
-        df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8')
+        with atomic_write(OUTPUT_FILE, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(results)
         print(f"✅ Results saved to {os.path.basename(OUTPUT_FILE)}")
         
-        successful = df[df['scopus_id'].notna()].shape[0]
-        failed = df[df['scopus_id'].isna()].shape[0]
+        successful = sum(1 for r in results if r.get('scopus_id'))
+        failed = len(results) - successful
         
         print("\n" + "=" * 60)
         print("SUMMARY")
@@ -525,20 +838,33 @@ def save_final_results(results: List[Dict], search_mode: str):
     except IOError as e:
         logger.error(f"Error saving results: {e}")
 
-def process_doi_item(item: str, api_key: str, cache: ResultCache, use_cache: bool) -> Dict:
-    """Process a single DOI item"""
+def lookup_cached_item(item: str, nkey: str, search_mode: str, cache: ResultCache) -> Optional[Dict]:
+    """Build result for an item from the cache, or None on cache miss"""
     global cache_hits
     
-    cached_result = cache.get(item) if use_cache else None
-    if cached_result:
+    cached_result = cache.get_or_none_normalized(nkey)
+    if not cached_result:
+        return None
+    
+    with stats_lock:
         cache_hits += 1
+    if search_mode == 'doi':
         return {
             'doi': item,
             'title': cached_result.get('title'),
             'scopus_id': cached_result.get('scopus_id'),
             'cached': True
         }
-    
+    return {
+        'search_title': item,
+        'found_title': cached_result.get('title'),
+        'scopus_id': cached_result.get('scopus_id'),
+        'doi': cached_result.get('doi'),
+        'cached': True
+    }
+
+def process_doi_item(item: str, nkey: str, api_key: str, cache: ResultCache, use_cache: bool) -> Dict:
+    """Process a single uncached DOI item"""
     title, scopus_id = search_scopus_api(item, api_key)
     
     if not scopus_id:
@@ -552,26 +878,38 @@ def process_doi_item(item: str, api_key: str, cache: ResultCache, use_cache: boo
     }
     
     if scopus_id and use_cache:
-        cache.set(item, {'title': title, 'scopus_id': scopus_id, 'source': 'scopus'})
+        cache.set_normalized(nkey, {'title': title, 'scopus_id': scopus_id, 'source': 'scopus'})
     
-    time.sleep(DELAY_BETWEEN_REQUESTS)
     return result
 
-def process_title_item(item: str, api_key: str, cache: ResultCache, use_cache: bool) -> Dict:
-    """Process a single title item"""
-    global cache_hits
-    
-    cached_result = cache.get(item) if use_cache else None
-    if cached_result:
-        cache_hits += 1
-        return {
-            'search_title': item,
-            'found_title': cached_result.get('title'),
-            'scopus_id': cached_result.get('scopus_id'),
-            'doi': cached_result.get('doi'),
-            'cached': True
-        }
-    
+def process_doi_batch(items: List[Tuple[str, str]], api_key: str, cache: ResultCache, use_cache: bool) -> List[Optional[Dict]]:
+    """Process a batch of uncached (DOI, normalized key) items with one Scopus query - None for items not found"""
+    found = search_scopus_api_batch([item for item, _ in items], api_key)
+    
+    results = []
+    for item, nkey in items:
+        title, scopus_id = found.get(nkey, (None, None))
+        if not scopus_id:
+            results.append(None)
+            continue
+        
+        results.append({
+            'doi': item,
+            'title': title,
+            'scopus_id': scopus_id,
+            'cached': False
+        })
+        if use_cache:
+            cache.set_normalized(nkey, {'title': title, 'scopus_id': scopus_id, 'source': 'scopus'})
+    
+    return results
+
+def process_doi_items(items: List[Tuple[str, str]], api_key: str, cache: ResultCache, use_cache: bool) -> List[Dict]:
+    """Process uncached (DOI, normalized key) items one by one with single lookups"""
+    return [process_doi_item(item, nkey, api_key, cache, use_cache) for item, nkey in items]
+
+def process_title_item(item: str, nkey: str, api_key: str, cache: ResultCache, use_cache: bool) -> Dict:
+    """Process a single uncached title item"""
     title_found, scopus_id, doi = search_scopus_api_title(item, api_key)
     
     if not scopus_id:
@@ -586,19 +924,58 @@ def process_title_item(item: str, api_key: str, cache: ResultCache, use_cache: b
     }
     
     if scopus_id and use_cache:
-        cache.set(item, {'title': title_found, 'scopus_id': scopus_id, 'doi': doi, 'source': 'scopus'})
+        cache.set_normalized(nkey, {'title': title_found, 'scopus_id': scopus_id, 'doi': doi, 'source': 'scopus'})
     
-    time.sleep(DELAY_BETWEEN_REQUESTS)
     return result
 
+def process_title_batch(items: List[Tuple[str, str]], api_key: str, cache: ResultCache, use_cache: bool) -> List[Dict]:
+    """Process a batch of uncached (title, normalized key) items one by one (Scopus has no batched title search)"""
+    return [process_title_item(item, nkey, api_key, cache, use_cache) for item, nkey in items]
+
+def iter_completed(futures: Dict, submit_miss) -> Iterator[Tuple[int, Dict]]:
+    """Yield (absolute_index, result) pairs as worker batches complete, resubmitting batch misses (None) via submit_miss"""
+    not_done = set(futures)
+    while not_done:
+        done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+        for future in done:
+            for entry, result in zip(futures[future], future.result()):
+                if result is None:
+                    retry = submit_miss(entry[1])
+                    futures[retry] = [entry]
+                    not_done.add(retry)
+                else:
+                    yield entry[0], result
+
+def report_result(result: Dict, absolute_index: int, total: int, search_mode: str):
+    """Log progress for a processed item"""
+    if search_mode == 'doi':
+        progress_logger.info("[%d/%d] DOI: %s", absolute_index, total, result['doi'])
+    else:
+        progress_logger.info("[%d/%d] Title: %.80s...", absolute_index, total, result['search_title'])
+    
+    if result.get('cached'):
+        progress_logger.info("    💾 Cached result")
+    else:
+        progress_logger.info("    🔍 Scopus API...")
+    
+    found_title = result.get('title') if search_mode == 'doi' else result.get('found_title')
+    if found_title:
+        progress_logger.info("    ✅ %s: %.100s...", 'Title' if search_mode == 'doi' else 'Found', found_title)
+    if result.get('scopus_id'):
+        progress_logger.info("    ✅ Scopus ID: %s", result['scopus_id'])
+    else:
+        progress_logger.info("    ⚠️ Scopus ID not found")
+    if search_mode == 'title' and result.get('doi'):
+        progress_logger.info("    🔗 DOI: %s", result['doi'])
+    progress_logger.info("")
+
 # ============================================================
 # MAIN
 # ============================================================
 
 def main():
     """Main execution"""
-    global interrupt_flag
-    
+    global present_files
     parser = argparse.ArgumentParser(
         description='Extract Scopus ID from DOI/Title',
         epilog="""
@@ -627,6 +1004,7 @@ Output: scopus_results.csv
     parser.add_argument('--skip-duplicates', action='store_true', help='Skip duplicate entries')
     parser.add_argument('--no-cache', action='store_true', help='Bypass response cache')
     parser.add_argument('--dry-run', action='store_true', help='Validate only, do not process')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show per-item progress details')
     
     parser.add_argument('--test-key', action='store_true', help='Test Scopus API key')
     parser.add_argument('--reset-key', action='store_true', help='Delete saved Scopus API key')
@@ -635,10 +1013,15 @@ Output: scopus_results.csv
     
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     signal.signal(signal.SIGINT, signal_handler)
+    present_files = scan_script_dir()
     create_gitignore_entry()
+    rate_limiter.interval = DELAY_BETWEEN_REQUESTS / args.workers
     
-    cache = ResultCache(CACHE_FILE)
+    cache = ResultCache(CACHE_FILE, legacy_file=LEGACY_CACHE_FILE)
     
     if args.cache_stats:
         stats = cache.stats()
@@ -653,11 +1036,14 @@ Output: scopus_results.csv
     
     if args.clear_cache:
         cache.clear()
+        if requests_cache is not None and file_present(HTTP_CACHE_FILE):
+            configure_session(args.workers)
+            SESSION.cache.clear()
         print("✅ Cache cleared")
         return
     
     if args.reset_key:
-        if os.path.exists(SCOPUS_KEY_FILE):
+        if file_present(SCOPUS_KEY_FILE):
             os.remove(SCOPUS_KEY_FILE)
             print(f"✅ Scopus API key deleted")
         else:
@@ -672,6 +1058,8 @@ Output: scopus_results.csv
         return
     
     if args.test_key:
+        # apiKey is ignored in HTTP cache keys, so always ask the server
+        configure_session(args.workers, use_cache=False)
         success, message = test_api_key(api_key)
         print(f"\n{'✅' if success else '❌'} {message}")
         return
@@ -725,11 +1113,13 @@ Output: scopus_results.csv
         print("\n✅ Dry run complete (no API calls made)")
         return
     
+    configure_session(args.workers, not args.no_cache)
+    
     start_index = 0
     existing_results = []
     
     if args.resume:
-        checkpoint = load_checkpoint()
+        checkpoint = load_checkpoint(search_mode)
         if checkpoint:
             start_index = checkpoint['metadata']['last_processed_index']
             existing_results = checkpoint['results']
@@ -748,79 +1138,84 @@ Output: scopus_results.csv
     
     print(f"\n🚀 Processing {len(items)} items...\n")
     
+    start_checkpoint(existing_results)
+    
     results = existing_results.copy()
+    pending = {}
+    next_index = start_index + 1
+    if search_mode == 'doi':
+        process_fn, batch_size = process_doi_batch, SCOPUS_BATCH_SIZE
+    else:
+        process_fn, batch_size = process_title_batch, 1
+    
+    # Resolve cache hits up front so only misses are dispatched to workers
+    cached_results = []
+    misses = []
+    for absolute_index, item in enumerate(items, start_index + 1):
+        nkey = normalize_key(item)
+        cached_result = None if args.no_cache else lookup_cached_item(item, nkey, search_mode, cache)
+        if cached_result:
+            cached_results.append((absolute_index, cached_result))
+        else:
+            misses.append((absolute_index, (item, nkey)))
+    
+    show_checkpoints = args.verbose or tqdm is None
+    progress_bar = None if show_checkpoints else tqdm(total=len(items), unit='item')
     
     try:
-        for i, item in enumerate(items, 1):
-            if interrupt_flag:
-                raise KeyboardInterrupt()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {}
+            for i in range(0, len(misses), batch_size):
+                entries = misses[i:i + batch_size]
+                future = executor.submit(process_fn, [item for _, item in entries], api_key, cache, not args.no_cache)
+                futures[future] = entries
             
-            absolute_index = start_index + i
+            def submit_miss(item):
+                return executor.submit(process_doi_items, [item], api_key, cache, not args.no_cache)
             
-            if search_mode == 'doi':
-                print(f"[{absolute_index}/{original_count}] DOI: {item}")
-                result = process_doi_item(item, api_key, cache, not args.no_cache)
-                
-                if result.get('cached'):
-                    print(f"    💾 Cached result")
-                else:
-                    print(f"    🔍 Scopus API...")
-                
-                if result.get('title'):
-                    print(f"    ✅ Title: {result['title'][:100]}...")
-                if result.get('scopus_id'):
-                    print(f"    ✅ Scopus ID: {result['scopus_id']}")
-                else:
-                    print(f"    ⚠️ Scopus ID not found")
-                
-                results.append({
-                    'doi': result['doi'],
-                    'title': result['title'],
-                    'scopus_id': result['scopus_id']
-                })
-            else:
-                print(f"[{absolute_index}/{original_count}] Title: {item[:80]}...")
-                result = process_title_item(item, api_key, cache, not args.no_cache)
-                
-                if result.get('cached'):
-                    print(f"    💾 Cached result")
-                else:
-                    print(f"    🔍 Scopus API...")
-                
-                if result.get('found_title'):
-                    print(f"    ✅ Found: {result['found_title'][:100]}...")
-                if result.get('scopus_id'):
-                    print(f"    ✅ Scopus ID: {result['scopus_id']}")
-                else:
-                    print(f"    ⚠️ Scopus ID not found")
-                if result.get('doi'):
-                    print(f"    🔗 DOI: {result['doi']}")
-                
-                results.append({
-                    'search_title': result['search_title'],
-                    'found_title': result['found_title'],
-                    'scopus_id': result['scopus_id'],
-                    'doi': result['doi']
-                })
-            
-            if i % 10 == 0:
-                metadata = {
-                    'search_mode': search_mode,
-                    'total_items': original_count,
-                    'last_processed_index': absolute_index,
-                    'timestamp': datetime.now().isoformat()
-                }
-                save_checkpoint(metadata, results)
-                successful = sum(1 for r in results if r.get('scopus_id'))
-                print(f"    💾 Checkpoint: {absolute_index}/{original_count} | Found: {successful}/{len(results)}")
-            
-            print()
+            try:
+                for absolute_index, result in chain(cached_results, iter_completed(futures, submit_miss)):
+                    if INTERRUPT.is_set():
+                        raise KeyboardInterrupt()
+                    
+                    if args.verbose:
+                        report_result(result, absolute_index, original_count, search_mode)
+                    if progress_bar is not None:
+                        progress_bar.update(1)
+                    pending[absolute_index] = {k: v for k, v in result.items() if k != 'cached'}
+                    
+                    # Keep results in input order so checkpoints stay a contiguous prefix
+                    while next_index in pending:
+                        results.append(pending.pop(next_index))
+                        if (next_index - start_index) % 10 == 0:
+                            metadata = {
+                                'search_mode': search_mode,
+                                'total_items': original_count,
+                                'last_processed_index': next_index,
+                                'timestamp': datetime.now().isoformat()
+                            }
+                            save_checkpoint(metadata, results)
+                            if show_checkpoints:
+                                successful = sum(1 for r in results if r.get('scopus_id'))
+                                progress_logger.info("    💾 Checkpoint: %d/%d | Found: %d/%d",
+                                                     next_index, original_count, successful, len(results))
+                                progress_handler.flush()
+                        next_index += 1
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
     
     except KeyboardInterrupt:
         print("\n⚠️ INTERRUPTED")
     finally:
+        if progress_bar is not None:
+            progress_bar.close()
+        progress_handler.flush()
+        results.extend(pending[index] for index in sorted(pending))
         print("\n💾 Saving results...")
         save_final_results(results, search_mode)
+        cache.flush()
         print("✅ Done")
 
 if __name__ == "__main__":